@@ -4,6 +4,7 @@ TODO
 """
 
 import asyncio
+import functools
 import click
 import pycmds
 import prompt_toolkit as pt
@@ -12,12 +13,18 @@ from prompt_toolkit.patch_stdout import patch_stdout
 from spookyconsole.exceptions import AbortPromptLoop
 
 
+@functools.lru_cache(maxsize=None)
+def _make_completer(root_cmd, prog_name):
+    # Building a completer walks the entire command tree, so it is done once per root command and reused by every
+    # Application. Commands must therefore all be added to root_cmd before the first Application is created.
+    return pycmds.CmdCompleter(root_cmd, prog_name=prog_name)
+
+
 class Application:
 
     def __init__(self, root_cmd, prog_name, prompt=">", gui_interval=20):
         self.commander = pycmds.Commander(root_cmd, name=prog_name, suppress_aborts=True)
-        self.prompt_session = pt.PromptSession(message=prompt,
-                                               completer=pycmds.CmdCompleter(root_cmd, prog_name=prog_name))
+        self.prompt_session = pt.PromptSession(message=prompt, completer=_make_completer(root_cmd, prog_name))
         self.commander.obj.prog_name = prog_name
         self.commander.obj.gui_interval = gui_interval
 
@@ -1,4 +1,6 @@
 
+import numpy as np
+
 
 def _num_slice_elements(sl: slice, len_seq: int):
     return len(range(*sl.indices(len_seq)))
@@ -10,6 +12,19 @@ def _assert_constant_length(key, value, len_seq, err_msg):
         raise ValueError(err_msg)
 
 
+def _object_array(values):
+    # Assigning element by element stops numpy from trying to broadcast any sequences stored in the grid.
+    ret = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        ret[i] = value
+    return ret
+
+
+def _contains(seq, item):
+    # Compare as list.__contains__ does (identity, then ==) rather than via numpy's elementwise ==.
+    return any(x is item or x == item for x in seq)
+
+
 class GridProxy:
 
     # TODO: Make column/row objects take a snapshot of grid? Only change underlying grid if not invalidated.
@@ -44,19 +59,20 @@ class GridProxy:
                 return self._grid.width
 
             def __contains__(self, item):
-                return item in self._grid.raw[self._idx]
+                return _contains(self, item)
 
             def __iter__(self):
-                return iter(self._grid.raw[self._idx])
+                return iter(self._grid._data[self._idx])
 
             def __getitem__(self, item):
-                return self._grid.raw[self._idx][item]
+                ret = self._grid._data[self._idx, item]
+                return ret.tolist() if isinstance(item, slice) else ret
 
             def __setitem__(self, key, value):
                 _assert_constant_length(key, value, len(self), "row length must remain constant")
-                if isinstance(key, slice) and not isinstance(value, list):
-                    value = list(value)
-                self._grid.raw[self._idx][key] = value
+                if isinstance(key, slice):
+                    value = _object_array(list(value))
+                self._grid._data[self._idx, key] = value
 
         def __init__(self, grid):
             self._grid = grid
@@ -75,16 +91,15 @@ class GridProxy:
         def __setitem__(self, key, value):
             if isinstance(key, slice):
                 _assert_constant_length(key, value, len(self), "column length must remain constant")
-                for i, row in enumerate(value):
+                for row in value:
                     if len(row) != self._grid.width:
                         raise ValueError("row length must remain constant")
-                    if not isinstance(row, list):
-                        value[i] = list(row)
+                for i, row in zip(range(*key.indices(len(self))), value):
+                    self._grid._data[i] = _object_array(list(row))
             elif len(value) != self._grid.width:
                 raise ValueError("row length must remain constant")
-            elif not isinstance(value, list):
-                value = list(value)
-            self._grid.raw[key] = value
+            else:
+                self._grid._data[key] = _object_array(list(value))
 
     class ColumnView:
 
@@ -98,23 +113,21 @@ class GridProxy:
                 return self._grid.height
 
             def __contains__(self, item):
-                return item in iter(self)
+                return _contains(self, item)
 
             def __iter__(self):
-                return (x[self._idx] for x in self._grid.raw)
+                # A strided view of the column; no copy is made.
+                return iter(self._grid._data[:, self._idx])
 
             def __getitem__(self, item):
-                if isinstance(item, slice):
-                    return [x[self._idx] for x in self._grid.raw[item]]
-                return self._grid.raw[item][self._idx]
+                ret = self._grid._data[item, self._idx]
+                return ret.tolist() if isinstance(item, slice) else ret
 
             def __setitem__(self, key, value):
                 if isinstance(key, slice):
                     _assert_constant_length(key, value, len(self), "column length must remain constant")
-                    for i in range(*key.indices(len(self))):
-                        self._grid.raw[i][self._idx] = value[i]
-                else:
-                    self._grid.raw[key][self._idx] = value
+                    value = _object_array(list(value))
+                self._grid._data[key, self._idx] = value
 
         def __init__(self, grid):
             self._grid = grid
@@ -136,17 +149,15 @@ class GridProxy:
                 for column in value:
                     if len(column) != self._grid.height:
                         raise ValueError("column length must remain constant")
-                for i, column in enumerate(range(*key.indices(len(self)))):
-                    for row in range(self._grid.height):
-                        self._grid.raw[row][column] = value[i][row]
+                for column, values in zip(range(*key.indices(len(self))), value):
+                    self._grid._data[:, column] = _object_array(list(values))
             else:
                 if len(value) != self._grid.height:
                     raise ValueError("column length must remain constant")
-                for row in range(self._grid.height):
-                    self._grid.raw[row][key] = value[row]
+                self._grid._data[:, key] = _object_array(list(value))
 
     def __init__(self, width, height):
-        self._data = [[None] * width for _ in range(height)]
+        self._data = np.full((height, width), None, dtype=object)
         self._row_view = None
         self._column_view = None
         self._width = width
@@ -164,7 +175,8 @@ class GridProxy:
 
     @property
     def raw(self):
-        return self._data
+        # The cells live in a numpy object array, but a (copied) list of lists is handed out, as before.
+        return self._data.tolist()
 
     @property
     def rows(self):
@@ -193,20 +205,12 @@ class GridProxy:
     def set_size(self, width=None, height=None):
         width = self._width if width is None else width
         height = self._height if height is None else height
-        delta_height = height - self.height
-        if delta_height > 0:
-            for _ in range(delta_height):
-                self._data += [[None] * width]
-        elif delta_height < 0:
-            self._data = self._data[:delta_height]
-        delta_width = width - self._width
-        if delta_width:
-            for i in range(min(height, self._height)):
-                if delta_width > 0:
-                    self._data[i] += [None] * delta_width
-                else:
-                    self._data[i] = self._data[i][:delta_width]
-            self._width = width
+        data = np.full((height, width), None, dtype=object)
+        keep_height = min(height, self._height)
+        keep_width = min(width, self._width)
+        data[:keep_height, :keep_width] = self._data[:keep_height, :keep_width]
+        self._data = data
+        self._width = width
         self._height = height
 
     def items_iter_rowwise(self):
@@ -216,11 +220,10 @@ class GridProxy:
         return self._unravel(self.columns)
 
     def transpose(self):
-        w, h = self._width, self._height
-        max_dim = max(w, h)
-        self.set_size(max_dim, max_dim)
-        self.rows[:] = self.columns[:]
-        self.set_size(h, w)
+        # The transposed view shares the underlying buffer, so no cells are copied. Writes through rows and columns
+        # remain valid on the (now Fortran-ordered) view, and set_size allocates a fresh array anyway.
+        self._data = self._data.T
+        self._width, self._height = self._height, self._width
 
     @staticmethod
     def _unravel(view):
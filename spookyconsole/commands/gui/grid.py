@@ -20,7 +20,8 @@ class TkinterColourParamType(click.ParamType):
     def _is_valid_colour(ctx, colour):
         root = ctx.obj.gui.manager.root
         try:
-            tk.Button(root, bg=colour).destroy()
+            # winfo_rgb parses the colour through the same Tk routine a widget would, without creating a widget.
+            root.winfo_rgb(colour)
             return True
         except tk.TclError:
             return False
@@ -3,12 +3,11 @@
 TODO
 """
 
-from collections import namedtuple
+import math
 import click
 import pycmds
 from networktables.networktables import NetworkTables
 from networktables.instance import NetworkTablesInstance
-import tabulate
 from spookyconsole.nt import ntutils
 
 
@@ -36,7 +35,7 @@ def get(entry):
 @click.pass_context
 def set_(ctx, entry, value, kind):
     print(f"entry: {entry},{type(entry)}; value: {repr(value)},{type(value)}; kind: {kind},{type(kind)}")
-    return ntutils.set_entry_by_type(entry, ntutils.type_cast(value, kind, ctx))
+    return ntutils.set_entry_by_type(entry, ntutils.type_cast(value, kind, ctx), kind)
 
 
 @click.command()
@@ -52,9 +51,173 @@ def pwd(ctx):
     return ctx.obj.nt_path
 
 
-ListElement = namedtuple("ListElement", ("is_entry", "key", "parent"))
 list_aliases = ["ls", "dir"]
 
+# The values of list_'s "output" flag for which entries and tables, respectively, are listed.
+_ENTRIES_OUTPUTS = frozenset(("entries", "both"))
+_TABLES_OUTPUTS = frozenset(("tables", "both"))
+
+
+# The cell types tabulate tells apart when deciding how to format and align a column, from least to most generic. A
+# column takes on the most generic type among its cells.
+_NONE, _BOOL, _INT, _FLOAT, _BYTES, _STR = range(6)
+
+
+def _parses_as(conv, cell):
+    try:
+        conv(cell)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _is_number(cell):
+    if type(cell) in (float, int):
+        return True
+    if not _parses_as(float, cell):
+        return False
+    if not isinstance(cell, (str, bytes)):
+        return True
+    # Strings which overflow to infinity (e.g. "1e999") aren't taken for numbers, but ones spelling it out are.
+    num = float(cell)
+    return not (math.isinf(num) or math.isnan(num)) or cell.lower() in ("inf", "-inf", "nan")
+
+
+def _cell_type(cell):
+    if cell is None or (isinstance(cell, (str, bytes)) and not cell):
+        return _NONE
+    if hasattr(cell, "isoformat"):
+        return _STR
+    is_text = isinstance(cell, (str, bytes))
+    if type(cell) is bool or (is_text and cell in ("True", "False")):
+        return _BOOL
+    if type(cell) is int or (is_text and _parses_as(int, cell)):
+        return _INT
+    if _is_number(cell):
+        return _FLOAT
+    if isinstance(cell, bytes):
+        return _BYTES
+    return _STR
+
+
+def _format_cell(cell, col_type):
+    if cell is None or (isinstance(cell, (str, bytes)) and not cell):
+        return ""
+    if col_type == _FLOAT:
+        try:
+            return format(float(cell), "g")
+        except (ValueError, TypeError):
+            pass
+    elif col_type == _BYTES:
+        try:
+            return str(cell, "ascii")
+        except (TypeError, UnicodeDecodeError):
+            return str(cell)
+    return f"{cell}"
+
+
+def _after_point(string):
+    """
+    Get the number of characters after the decimal point (or exponent) of a formatted number, or -1 if there is none.
+    """
+    if not _is_number(string) or _parses_as(int, string):
+        return -1
+    pos = string.rfind(".")
+    if pos < 0:
+        pos = string.lower().rfind("e")
+    return len(string) - pos - 1 if pos >= 0 else -1
+
+
+def _format_fancy_grid(header, rows):
+    """
+    Render a table as ``tabulate.tabulate(rows, header, tablefmt="fancy_grid")`` would for the kinds of values found in
+    NetworkTables. Each column's type is inferred from its cells as tabulate does: numeric columns are aligned on the
+    decimal point (with floats formatted per "g") and everything else is stripped and left-aligned. Cells spanning
+    several lines are split on their line breaks, the row growing to fit the tallest. Unlike tabulate, ANSI escape
+    codes, thousands separators, and wide characters get no special treatment, and a row of only empty cells always
+    takes up a line.
+
+    :param header: The column headers.
+    :type header: tuple
+    :param rows: The rows of the table, each of which is a sequence of values as long as ``header``.
+    :type rows: list
+    :return: The rendered table.
+    :rtype: str
+    """
+    widths = []
+    header_cells = []
+    columns = []
+    for title, cells in zip(header, list(zip(*rows)) or [()] * len(header)):
+        col_type = max(map(_cell_type, cells), default=_NONE)
+        strings = [_format_cell(cell, col_type) for cell in cells]
+        if col_type in (_INT, _FLOAT):
+            decimals = list(map(_after_point, strings))
+            max_decimals = max(decimals)
+            strings = [s + " " * (max_decimals - d) for s, d in zip(strings, decimals)]
+            pad = str.rjust
+        else:
+            strings = [s.strip() for s in strings]
+            pad = str.ljust
+        cell_lines = [s.splitlines() or [""] for s in strings]
+        title_lines = title.splitlines() or [""]
+        # Like tabulate, leave at least two spaces beside each header.
+        width = max(max(map(len, title_lines)) + 2,
+                    max((len(line) for lines in cell_lines for line in lines), default=0))
+        widths.append(width)
+        header_cells.append([pad(line, width) for line in title_lines])
+        columns.append([[pad(line, width) for line in lines] for lines in cell_lines])
+
+    bars = tuple("═" * (w + 2) for w in widths)
+    top = "╒" + "╤".join(bars) + "╕"
+    below_header = "╞" + "╪".join(bars) + "╡"
+    between = "├" + "┼".join("─" * (w + 2) for w in widths) + "┤"
+    bottom = "╘" + "╧".join(bars) + "╛"
+    blanks = tuple(" " * w for w in widths)
+
+    def add_row(row):
+        # Cells with fewer lines than the tallest in the row are padded out with blank lines below.
+        for i in range(max(map(len, row))):
+            add_line("│ " + " │ ".join(cell[i] if i < len(cell) else blank for cell, blank in zip(row, blanks))
+                     + " │")
+
+    lines = [top]
+    add_line = lines.append
+    add_row(header_cells)
+    add_line(below_header)
+    for i, row in enumerate(zip(*columns)):
+        if i:
+            add_line(between)
+        add_row(row)
+    add_line(bottom)
+    return "\n".join(lines)
+
+
+def _make_entry_row_builder(prefix, kind, value):
+    """
+    Create the function ``list_`` uses to build each entry's row. Which columns are present is fixed for the whole
+    listing, so a variant without any per-row conditionals is picked once up front.
+
+    :param prefix: The cells preceding the entry's key (i.e. the table/entry marker, if any).
+    :type prefix: tuple
+    :param kind: Whether to include the entry's type.
+    :type kind: bool
+    :param value: Whether to include the entry's value.
+    :type value: bool
+    :return: A function taking an entry's key and its entry info and returning the entry's row.
+    :rtype: function
+    """
+    # Unlike indexing TYPE_NAMES, type_constant_to_str copes with types it lacks (e.g. RPC or unassigned entries).
+    type_name = ntutils.type_constant_to_str
+    get_entry = NetworkTables.getEntry
+    # Only the value column needs an actual entry object; everything else comes from the entry info.
+    if kind and value:
+        return lambda key, info: prefix + (key, type_name(info.type), get_entry(info.name).value)
+    if kind:
+        return lambda key, info: prefix + (key, type_name(info.type))
+    if value:
+        return lambda key, info: prefix + (key, get_entry(info.name).value)
+    return lambda key, info: prefix + (key,)
+
 
 @click.command("list")
 @click.argument("path", type=ntutils.NT_PATH_TYPE, required=False)
@@ -69,23 +232,8 @@ def list_(ctx, path, recurse, output, value, kind):
     if path is None:
         path = ctx.obj.nt_path
 
-    find_entries = output in ("entries", "both")
-    find_tables = output in ("tables", "both")
-    table = NetworkTables.getTable(path)
-    items = []
-    if find_entries:
-        items.extend((ListElement(True, key, table) for key in table.getKeys()))
-    if find_tables or recurse:
-        items.extend((ListElement(False, key, table) for key in table.getSubTables()))
-    if recurse:
-        for item in items:
-            if item.is_entry:
-                continue
-            subtable = item.parent.getSubTable(item.key)
-            if find_entries:
-                items.extend((ListElement(True, key, subtable) for key in subtable.getKeys()))
-            items.extend((ListElement(False, key, subtable) for key in subtable.getSubTables()))
-
+    find_entries = output in _ENTRIES_OUTPUTS
+    find_tables = output in _TABLES_OUTPUTS
     item_type_column = output == "both"
 
     header = []
@@ -97,26 +245,46 @@ def list_(ctx, path, recurse, output, value, kind):
     if value:
         header.append("Value")
 
+    # The shape of each row depends only on the flags given, so the constant parts are built once here and each row is
+    # assembled as a tuple from them.
+    entry_prefix = ("E",) if item_type_column else ()
+    table_prefix = ("T",) if item_type_column else ()
+    table_padding = ("",) * (value + kind)
+    entry_row = _make_entry_row_builder(entry_prefix, kind, value)
+
+    def table_row(key):
+        return table_prefix + (key,) + table_padding
+
+    sep = NetworkTables.PATH_SEPARATOR
+    prefix = path if path.endswith(sep) else path + sep
     content = []
-    for item in items:
-        row = []
-        if item.is_entry and find_entries:
-            if item_type_column:
-                row.append("E")
-            row.append(item.key)
-            if value:
-                row.append(item.parent.getEntry(item.key).value)
-            if kind:
-                row.append(ntutils.type_constant_to_str(item.parent.getEntry(item.key).type))
-        elif find_tables:
-            if item_type_column:
-                row.append("T")
-            row.append(item.key)
-            if find_entries:
-                row.extend([""] * (value + kind))
-        content.append(row)
-
-    return tabulate.tabulate(content, header, tablefmt="fancy_grid")
+    # Bound locally since it's called once per row.
+    add_row = content.append
+    listed_tables = set()
+    # Rather than asking each table in turn for its keys and subtables (each of which scans the whole entry store),
+    # fetch the name and type of every entry below path in a single call and recover the tables from the entry names.
+    for info in NetworkTables.getEntryInfo(prefix, 0):
+        rel_name = info.name[len(prefix):]
+        if find_tables:
+            # Every separator in the relative name closes off one (possibly already listed) subtable. Without
+            # recursion, only the first one (a direct subtable of path) is of interest.
+            start = 0
+            end = rel_name.find(sep)
+            while end != -1:
+                table_name = rel_name[:end]
+                if table_name not in listed_tables:
+                    listed_tables.add(table_name)
+                    add_row(table_row(rel_name[start:end]))
+                if not recurse:
+                    break
+                start = end + 1
+                end = rel_name.find(sep, start)
+        if find_entries:
+            key_start = rel_name.rfind(sep) + 1
+            if recurse or not key_start:
+                add_row(entry_row(rel_name[key_start:], info))
+
+    return _format_fancy_grid(tuple(header), content)
 
 
 @click.command()
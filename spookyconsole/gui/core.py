@@ -2,9 +2,14 @@
 """Contains core functionality for the GUI component of spooky-console."""
 
 import tkinter as tk
+import _tkinter
 import numpy as np
 import asyncio
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from collections import namedtuple
+from functools import lru_cache
 import spookyconsole.gui.style as style
 
 
@@ -14,10 +19,43 @@ GridGeometry = namedtuple("GridGeometry", ("width", "height",
                                            "column_padding", "row_padding"))
 HighlightVisual = namedtuple("HighlightVisual", ("bd_width", "bd_colour", "fill"))
 GridVisual = namedtuple("GridVisual", ("width", "colour"))
-DockableEntry = namedtuple("DockableEntry", ("id", "cell"))
 Size = namedtuple("Size", ("width", "height"))
-Point = namedtuple("Point", ("x", "y"))
-BBox = namedtuple("BBox", ("x", "y", "w", "h"))
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def install_uvloop():
+    """
+    Opt in to using uvloop's event loop, whose timer handling is faster than that of asyncio's default event loop. This
+    benefits ``GuiManager.async_mainloop`` when a small interval is used. This must be called before the event loop is
+    created.
+
+    :return: Whether uvloop was installed (i.e. False if uvloop isn't available).
+    :rtype: bool
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def install_tkthread():
+    """
+    Opt in to using tkthread, which patches tkinter so that other threads may safely call into it (e.g. via
+    ``tkthread.call``). Such calls are dispatched to the tkinter thread directly rather than waiting on the next pump
+    of ``GuiManager.async_mainloop``. This must be called before the ``GuiManager`` is created.
+
+    :return: Whether tkthread was installed (i.e. False if tkthread isn't available).
+    :rtype: bool
+    """
+    try:
+        import tkthread
+    except ImportError:
+        return False
+    tkthread.patch()
+    return True
 
 
 class ScrollCanvas(style.Canvas):
@@ -45,8 +83,8 @@ class ScrollCanvas(style.Canvas):
     ``tkinter.Canvas``, meaning the styling conveniences provided in ``spookyconsole.gui.style`` may be utilized.
 
     This class handles binding both the scroll wheel movements (for vertical scrolling only) and mouse button 3 panning.
-    If this object is constructed without the ``bind_all`` flag, additional (child) widgets may be bound through
-    ``tag_widget`` so that they can accept mouse scroll/panning events and "relay" them to the canvas.
+    These are bound on a tkinter bind class unique to the canvas (rather than globally), so additional (child) widgets
+    must be bound through ``tag_widget`` for them to accept mouse scroll/panning events and "relay" them to the canvas.
     """
 
     MAX_SCROLLBAR_POS = (0, 1)
@@ -56,7 +94,6 @@ class ScrollCanvas(style.Canvas):
     """
 
     def __init__(self, master, width, height,
-                 bind_all=False,
                  scroll_wheel_scale=1/2,
                  pan_scale_x=1 / 2,
                  pan_scale_y=1 / 2,
@@ -70,8 +107,6 @@ class ScrollCanvas(style.Canvas):
         :type width: int
         :param height: The height of the scroll region in pixels.
         :type height: int
-        :param bind_all: Whether or not to bind mouse events globally or only on a tkinter bind class.
-        :type bind_all: bool
         :param scroll_wheel_scale: A multiplier for vertical scrolling using the mouse wheel.
         :type scroll_wheel_scale: float
         :param pan_scale_x: A multiplier for the horizontal panning using the third mouse button.
@@ -96,7 +131,20 @@ class ScrollCanvas(style.Canvas):
 
         self.x_scrollbar = style.Scrollbar(self.frame, style=scrollbar_style, command=self.xview, orient=tk.HORIZONTAL)
         self.y_scrollbar = style.Scrollbar(self.frame, style=scrollbar_style, command=self.yview)
-        self.configure(xscrollcommand=self.x_scrollbar.set, yscrollcommand=self.y_scrollbar.set,
+
+        self._x_at_max = True
+        """
+        Whether the x scrollbar is at ``ScrollCanvas.MAX_SCROLLBAR_POS`` (i.e. the scrollregion is fully visible
+        horizontally). This is kept up to date by ``ScrollCanvas._xscroll_set`` so it needn't be queried from tkinter.
+        """
+
+        self._y_at_max = True
+        """
+        Whether the y scrollbar is at ``ScrollCanvas.MAX_SCROLLBAR_POS`` (i.e. the scrollregion is fully visible
+        vertically). This is kept up to date by ``ScrollCanvas._yscroll_set`` so it needn't be queried from tkinter.
+        """
+
+        self.configure(xscrollcommand=self._xscroll_set, yscrollcommand=self._yscroll_set,
                        xscrollincrement=1, yscrollincrement=1, scrollregion=(0, 0, width, height))
 
         self.grid(row=0, column=0, sticky=tk.NSEW)
@@ -107,9 +155,18 @@ class ScrollCanvas(style.Canvas):
         self.frame.grid_rowconfigure(0, weight=1)
         self.frame.grid_columnconfigure(0, weight=1)
 
-        self.scroll_wheel_scale = scroll_wheel_scale
+        self._wheel_steps = {}
+        """
+        Caches how many units to scroll for each ``event.delta`` seen by ``ScrollCanvas._wheel_scroll``. Mouse wheels
+        only ever report a handful of distinct deltas. This is cleared whenever ``ScrollCanvas.scroll_wheel_scale`` is
+        set.
+        """
+
+        self._scroll_wheel_scale = None
         """A multiplier for vertical scrolling using the mouse wheel."""
 
+        self.scroll_wheel_scale = scroll_wheel_scale
+
         self.pan_scale_x = pan_scale_x
         """A multiplier for the horizontal panning using the third mouse button."""
 
@@ -123,34 +180,49 @@ class ScrollCanvas(style.Canvas):
         """
         Stores the mouse coordinates of where the user started panning so we may calculate how far away from this
         central position the user has dragged the mouse. Whether or not this variable is set is used as an indicator for
-        whether ``ScrollCanvas._wheel_press_update_view`` should continue running.
+        whether ``ScrollCanvas._pan_update_view`` should continue running.
         """
 
-        self._pan_delta_x = 0
+        self._pan_pos = None
         """
-        The change in x coordinate from the original x coordinate in ``ScrollCanvas._wheel_drag_start_pos``. This value
-        is proportional to how quickly panning happens in the horizontal direction.
+        Stores the latest mouse coordinates while the user is panning. Its distance from ``ScrollCanvas._pan_start_pos``
+        is proportional to how quickly panning happens. Motion events only record this; the distance is worked out by
+        ``ScrollCanvas._pan_update_view`` so that bursts of motion events between view updates cost next to nothing.
         """
 
-        self._pan_delta_y = 0
+        self._pan_after_id = None
         """
-        The change in y coordinate from the original y coordinate in ``ScrollCanvas._wheel_drag_start_pos``. This value
-        is proportional to how quickly panning happens in the vertical direction.
+        Stores the callback id for ``ScrollCanvas._pan_update_view`` while one is scheduled. No callback is scheduled
+        while the mouse rests where the user started panning, since the view wouldn't move anyway.
         """
 
+        self._bind_class_name = "ScrollCanvas{}".format(id(self))
+        """A unique identifier to be used as a tkinter bind class. See ``ScrollCanvas.bind_class_name``."""
+
         # Bindings. Note that what tkinter considers mouse button 2 (the scroll click) is more typically called mouse
         # button 3 (which is what I have been referring to it as).
-        if bind_all:
-            self.bind_all("<MouseWheel>", self._wheel_scroll)
-            self.bind_all("<Button-2>", self._wheel_press)
-            self.bind_all("<B2-Motion>", self._wheel_motion)
-            self.bind_all("<ButtonRelease-2>", self._wheel_release)
-        else:
-            self.tag_widget(self)
-            self.bind_class(self.bind_class_name, "<MouseWheel>", self._wheel_scroll)
-            self.bind_class(self.bind_class_name, "<Button-2>", self._wheel_press)
-            self.bind_class(self.bind_class_name, "<B2-Motion>", self._wheel_motion)
-            self.bind_class(self.bind_class_name, "<ButtonRelease-2>", self._wheel_release)
+        self.tag_widget(self)
+        self.bind_class(self.bind_class_name, "<MouseWheel>", self._wheel_scroll)
+        self.bind_class(self.bind_class_name, "<Button-2>", self._wheel_press)
+        self.bind_class(self.bind_class_name, "<B2-Motion>", self._wheel_motion)
+        self.bind_class(self.bind_class_name, "<ButtonRelease-2>", self._wheel_release)
+
+    @property
+    def scroll_wheel_scale(self):
+        """
+        :return: A multiplier for vertical scrolling using the mouse wheel.
+        :rtype: float
+        """
+        return self._scroll_wheel_scale
+
+    @scroll_wheel_scale.setter
+    def scroll_wheel_scale(self, scale):
+        """
+        :param scale: A new multiplier for vertical scrolling using the mouse wheel.
+        :type scale: float
+        """
+        self._scroll_wheel_scale = scale
+        self._wheel_steps.clear()
 
     @property
     def bind_class_name(self):
@@ -158,14 +230,12 @@ class ScrollCanvas(style.Canvas):
         :return: A unique identifier to be used as a tkinter bind class.
         :rtype: str
         """
-        return "ScrollCanvas{}".format(id(self))
+        return self._bind_class_name
 
     def tag_widget(self, widget):
         """
         Add this ``ScrollCanvas``'s unique bind class to a tkinter widget so that said widget "relays" its mouse events
-        (namely, scrolling and panning with mouse button 3) to the canvas. This will have no effect if the canvas was
-        constructed with the ``bind_all`` flag, in which case the given widget should already "relay" its mouse events
-        to the canvas.
+        (namely, scrolling and panning with mouse button 3) to the canvas.
 
         :param widget: The tkinter widget to add the tag to.
         """
@@ -183,6 +253,26 @@ class ScrollCanvas(style.Canvas):
         """
         self.configure(scrollregion=(0, 0, width, height))
 
+    def _xscroll_set(self, first, last):
+        """
+        Internal method used as the canvas's "xscrollcommand". Updates the x scrollbar and ``ScrollCanvas._x_at_max``.
+
+        :param first: The fraction of the scrollregion's width left of the visible area.
+        :param last: The fraction of the scrollregion's width left of and including the visible area.
+        """
+        self._x_at_max = (float(first), float(last)) == self.MAX_SCROLLBAR_POS
+        self.x_scrollbar.set(first, last)
+
+    def _yscroll_set(self, first, last):
+        """
+        Internal method used as the canvas's "yscrollcommand". Updates the y scrollbar and ``ScrollCanvas._y_at_max``.
+
+        :param first: The fraction of the scrollregion's height above the visible area.
+        :param last: The fraction of the scrollregion's height above and including the visible area.
+        """
+        self._y_at_max = (float(first), float(last)) == self.MAX_SCROLLBAR_POS
+        self.y_scrollbar.set(first, last)
+
     def _wheel_scroll(self, event):
         """
         Internal method used as the callback for "<MouseWheel>" events.
@@ -191,8 +281,12 @@ class ScrollCanvas(style.Canvas):
         """
         # There's a weird situation where the user can scroll in the negative direction even when all of the
         # scrollregion is visible; this conditional prevents that from happening.
-        if self.y_scrollbar.get() != self.MAX_SCROLLBAR_POS:
-            self.yview_scroll(-1 * int(event.delta * self.scroll_wheel_scale), tk.UNITS)
+        if not self._y_at_max:
+            try:
+                step = self._wheel_steps[event.delta]
+            except KeyError:
+                step = self._wheel_steps[event.delta] = -1 * int(event.delta * self._scroll_wheel_scale)
+            self.tk.call(self._w, "yview", "scroll", step, tk.UNITS)
 
     def _wheel_press(self, event):
         """
@@ -203,10 +297,9 @@ class ScrollCanvas(style.Canvas):
         # Set the cursor. "fleur" is a 4-directional arrow typical to panning.
         self.configure(cursor="fleur")
         # Record the starting mouse position of the pan. This is used to calculate how far the mouse has moved from this
-        # starting position and ultimately has sensitive the panning should be.
-        self._pan_start_pos = Point(event.x, event.y)
-        # Start the update view callback chain, which is called repeatedly while mouse button 3 is held.
-        self._pan_update_view()
+        # starting position and ultimately has sensitive the panning should be. The update view callback chain isn't
+        # started until the mouse actually moves (see _wheel_motion).
+        self._pan_start_pos = self._pan_pos = (event.x, event.y)
 
     def _wheel_motion(self, event):
         """
@@ -214,50 +307,70 @@ class ScrollCanvas(style.Canvas):
 
         :param event: The tkinter event object.
         """
-        # There's a weird situation where the user can scroll in the negative direction even when all of the
-        # scrollregion is visible; the following two conditionals prevent that from happening.
-        if self.x_scrollbar.get() != self.MAX_SCROLLBAR_POS:
-            # Record the x distance moved from the starting position.
-            self._pan_delta_x = event.x - self._pan_start_pos.x
-        if self.y_scrollbar.get() != self.MAX_SCROLLBAR_POS:
-            # Record the y distance moved from the starting position.
-            self._pan_delta_y = event.y - self._pan_start_pos.y
+        self._pan_pos = (event.x, event.y)
+        # (Re)start the update view callback chain if it isn't already running, e.g. if it stopped while the mouse was
+        # resting where the pan started.
+        if not self._pan_after_id:
+            self._pan_after_id = self.after(self.pan_delay, self._pan_update_view)
 
     def _wheel_release(self, _):
         """Internal method used as the callback for "<ButtonRelease-2>" (scroll click release) events."""
         # Reconfigure the mouse cursor to the standard arrow.
         self.configure(cursor="left_ptr")
-        # Reset all the state variables associated with panning. Note that setting the _wheel_drag_start_pos variable to
-        # None effectively cancels the view update callback since it uses whether that variable is set as an indicator
-        # for whether or not the user is panning.
+        # Reset all the state variables associated with panning and cancel the view update callback.
+        if self._pan_after_id:
+            self.after_cancel(self._pan_after_id)
+            self._pan_after_id = None
         self._pan_start_pos = None
-        self._pan_delta_x = 0
-        self._pan_delta_y = 0
+        self._pan_pos = None
 
     def _pan_update_view(self):
         """
         Internal method scheduled by itself with ``tkinter.Misc.after`` to repeatedly update the canvas's view. This
-        chained calling is initiated in ``ScrollCanvas._wheel_press`` and stops once ``ScrollCanvas._wheel_release``
-        unsets ``ScrollCanvas._wheel_drag_start_pos``.
+        chained calling is initiated in ``ScrollCanvas._wheel_motion``. It stops once ``ScrollCanvas._wheel_release``
+        cancels it or whenever the mouse is back near where the pan started, in which case the next motion restarts it.
         """
+        self._pan_after_id = None
+        if not self._pan_start_pos:
+            return
         # Notice the scroll speed is proportional to the how far the mouse has been moved from when the mouse scroll
         # click started and to the appropriate scale factor.
-        self.xview_scroll(int(self._pan_delta_x * self.pan_scale_x), tk.UNITS)
-        self.yview_scroll(int(self._pan_delta_y * self.pan_scale_y), tk.UNITS)
-        if self._pan_start_pos:
-            self.after(self.pan_delay, self._pan_update_view)
+        x, y = self._pan_pos
+        start_x, start_y = self._pan_start_pos
+        dx = int((x - start_x) * self.pan_scale_x)
+        dy = int((y - start_y) * self.pan_scale_y)
+        # Scrolling by zero units is a no-op, so while the mouse rests near where the pan started (which is most of the
+        # time), skip the round trip to Tcl and let the chain stop until the next motion event.
+        if not (dx or dy):
+            return
+        # Tcl is called directly since the xview_scroll and yview_scroll wrappers add nothing but overhead here.
+        # There's a weird situation where the user can scroll in the negative direction even when all of the
+        # scrollregion is visible; the scrollbar checks prevent that from happening.
+        if dx and not self._x_at_max:
+            self.tk.call(self._w, "xview", "scroll", dx, tk.UNITS)
+        if dy and not self._y_at_max:
+            self.tk.call(self._w, "yview", "scroll", dy, tk.UNITS)
+        self._pan_after_id = self.after(self.pan_delay, self._pan_update_view)
 
 
 class GridState(np.ndarray):
     """
-    A wrapper around a numpy array of booleans for storing the state of a ``Grid`` instance. That is, each element in
-    the ``GridState`` stores whether or not the corresponding grid cell is populated (i.e. contains part of a
+    A wrapper around a numpy array of row bitmaps for storing the state of a ``Grid`` instance. That is, each bit in the
+    ``GridState`` stores whether or not the corresponding grid cell is populated (i.e. contains part of a
     ``DockableMixin`` widget).
 
-    A numpy array in particular is used for this purpose chiefly for the convenience provided by fancy indexing. This
-    makes checking for grid conflicts with a prospect dockable placement rather simple (and fast).
+    Each row of the grid is packed into as many ``GridState.WORD_BITS``-bit unsigned integers as are needed to cover the
+    grid's width, with column zero being the least significant bit of the first integer. The array is therefore shaped
+    ``(height, words)``. Checking for grid conflicts with a prospect dockable placement then amounts to ANDing a column
+    mask against the rows it would span, which is a handful of integer operations rather than one per cell.
     """
 
+    WORD_BITS = 64
+    """How many grid columns are packed into each element of the array."""
+
+    WORD_MASK = (1 << WORD_BITS) - 1
+    """A Python integer with every bit of a single array element set."""
+
     def __new__(cls, width, height):
         """
         (Numpy does initialization in ``__new__``, not ``__init__``!)
@@ -266,12 +379,11 @@ class GridState(np.ndarray):
         :type width: int
         :param height: The height of the grid to be represented by this array.
         :type height: int
-        :return: The new ``GridState`` object, initialized to all false values.
+        :return: The new ``GridState`` object, initialized to all unpopulated cells.
         :rtype: GridState
         """
-        obj = super().__new__(cls, (height, width), dtype=bool)
-        obj.fill(False)
-        return obj
+        # np.zeros gets its memory zeroed by the allocator, which is cheaper than allocating and then filling it.
+        return np.zeros((height, (width + cls.WORD_BITS - 1) // cls.WORD_BITS), dtype=np.uint64).view(cls)
 
     @property
     def min_width(self):
@@ -279,12 +391,10 @@ class GridState(np.ndarray):
         :return: The minimum width the grid may be shrunk to before a dockable would be "clipped".
         :rtype: int
         """
-        try:
-            # Sum the columns and find the maximum (i.e. last) index in which a column sums to zero (indicating no cells
-            # in that column are populated).
-            return np.where(self.sum(axis=0) > 0)[0].max() + 1
-        except ValueError:
-            return 0
+        # OR all the rows together so that each set bit marks a column populated in at least one row. The minimum width
+        # is then one past the most significant set bit, which int.bit_length gives directly (and is zero when no bits
+        # are set).
+        return self._join_words(np.bitwise_or.reduce(self, axis=0)).bit_length()
 
     @property
     def min_height(self):
@@ -292,19 +402,9 @@ class GridState(np.ndarray):
         :return: The minimum height the grid may be shrunk to before a dockable would be "clipped".
         :rtype: int
         """
-        try:
-            # Sum the rows and find the maximum (i.e. last) index in which a row sums to zero (indicating no cells in
-            # that row are populated).
-            return np.where(self.sum(axis=1) > 0)[0].max() + 1
-        except ValueError:
-            return 0
-
-    def empty_copy(self):
-        """
-        :return: An empty copy (i.e. same size) of the grid.
-        :rtype: GridState
-        """
-        return GridState(*self.shape)
+        # Find the last row with any populated cells.
+        rows = np.flatnonzero(self.any(axis=1))
+        return int(rows[-1]) + 1 if rows.size else 0
 
     def conflicts(self, cell, col_span, row_span):
         """
@@ -321,25 +421,48 @@ class GridState(np.ndarray):
         :rtype: bool
         """
         col, row = cell
-        return self[row:row+row_span, col:col+col_span].any()
+        return bool((self[row:row+row_span] & self._mask(col, col_span)).any())
 
-    def conflicts_where(self, cell, col_span, row_span):
+    def placements(self, col_span, row_span, width):
         """
-        Determine each location in which a dockable with the given dimensions placed at the given cell would conflict
-        with the current grid state (i.e. one or more dockables would "overlap") and return the result as a copy of this
-        grid state.
+        Determine every cell at which a dockable with the given dimensions could be placed without conflicting with the
+        current grid state or overhanging the edges of the grid.
 
-        :param cell: The prospect top-left coordinate of the dockable.
-        :type cell: Cell
         :param col_span: The column span of the dockable.
         :type col_span: int
         :param row_span: The row span of the dockable.
         :type row_span: int
-        :return: A ``GridState`` object in which every conflict is represented by a true value in the corresponding
-        cell.
-        :rtype: GridState
-        """
-        return self.empty_copy().populate(cell, col_span, row_span) & self
+        :param width: The width of the grid in cells. This must be given since the rows are padded to whole words.
+        :type width: int
+        :return: A boolean array indexed by row and then column in which every top-left cell the dockable could be
+        placed at is true. It only spans the rows and columns the dockable could possibly start at.
+        :rtype: numpy.ndarray
+        """
+        n_rows = self.shape[0] - row_span + 1
+        n_cols = width - col_span + 1
+        if n_rows <= 0 or n_cols <= 0:
+            return np.zeros((max(n_rows, 0), max(n_cols, 0)), dtype=bool)
+        # Join the words of each row into a single Python integer so the shifts below needn't care about word
+        # boundaries.
+        rows = [self._join_words(row) for row in self]
+        free_mask = (1 << width) - 1
+        n_bytes = (n_cols + 7) // 8
+        starts_bytes = bytearray()
+        for row in range(n_rows):
+            used = 0
+            for bits in rows[row:row+row_span]:
+                used |= bits
+            # Repeatedly AND the free columns with themselves shifted down so that a bit survives only if the col_span
+            # columns starting at it are all free. Doubling the covered span each time takes O(log(col_span)) steps.
+            starts = ~used & free_mask
+            span = 1
+            while span < col_span:
+                shift = min(span, col_span - span)
+                starts &= starts >> shift
+                span += shift
+            starts_bytes += starts.to_bytes(n_bytes, "little")
+        starts_array = np.frombuffer(bytes(starts_bytes), dtype=np.uint8).reshape(n_rows, n_bytes)
+        return np.unpackbits(starts_array, axis=1, count=n_cols, bitorder="little").astype(bool)
 
     def populate(self, cell, col_span, row_span):
         """
@@ -384,7 +507,61 @@ class GridState(np.ndarray):
         :type val: bool
         """
         col, row = cell
-        self[row:row+row_span, col:col+col_span] = val
+        mask = self._mask(col, col_span)
+        if val:
+            self[row:row+row_span] |= mask
+        else:
+            self[row:row+row_span] &= ~mask
+
+    @staticmethod
+    def _join_words(words):
+        """
+        Internal function to join the words of a row bitmap into a single Python integer.
+
+        :param words: The row bitmap.
+        :type words: numpy.ndarray
+        :return: The row bitmap as an integer, with column zero as the least significant bit.
+        :rtype: int
+        """
+        return int.from_bytes(words.astype("<u8").tobytes(), "little")
+
+    def _mask(self, col, col_span):
+        """
+        Internal function to build a row bitmap in which only the bits for the ``col_span`` columns starting at ``col``
+        are set.
+
+        :param col: The first column to set.
+        :type col: int
+        :param col_span: How many columns to set.
+        :type col_span: int
+        :return: The row bitmap, suitable for combining with rows of this grid state.
+        :rtype: numpy.ndarray
+        """
+        return self._cached_mask(col, col_span, self.shape[1])
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_mask(col, col_span, words):
+        """
+        Internal function backing ``GridState._mask``. Every conflict check and (un)population needs a mask, and a
+        dockable being dragged around asks for the same few over and over, so they're cached. The returned arrays are
+        shared and hence read-only.
+
+        :param col: The first column to set.
+        :type col: int
+        :param col_span: How many columns to set.
+        :type col_span: int
+        :param words: How many words are in each row of the grid state.
+        :type words: int
+        :return: The row bitmap.
+        :rtype: numpy.ndarray
+        """
+        # Build the mask as a single (arbitrarily long) Python integer and then split it into words.
+        bits = ((1 << col_span) - 1) << col
+        mask = np.array([(bits >> (i * GridState.WORD_BITS)) & GridState.WORD_MASK for i in range(words)],
+                        dtype=np.uint64)
+        mask.flags.writeable = False
+        return mask
 
 
 class Grid(ScrollCanvas):
@@ -464,9 +641,6 @@ class Grid(ScrollCanvas):
     RESIZE_PROTO_ADD_PADDING = 2
     """One of the resize protocols: Add padding equally in between each column or row when the window is resized."""
 
-    RESIZE_UPDATE_DELAY = 50
-    """How frequently in milliseconds to update this grid's geometry when the window size is changed."""
-
     def __init__(self, master, width, height,
                  cell_width=50, cell_height=50,
                  column_padding=0, row_padding=0,
@@ -511,17 +685,67 @@ class Grid(ScrollCanvas):
         self._curr_cell = None
         """The top-left ``Cell`` of the group of cells currently being hovered over."""
 
+        self._drag_motion_after_id = None
+        """
+        Stores the callback id for ``Grid._update_drag_position`` while one is scheduled by ``Grid.signal_drag_motion``,
+        so that bursts of motion events are handled by a single update.
+        """
+
+        self._drag_root_pos = None
+        """
+        The (x, y) position of this grid relative to the screen, queried once when a drag starts since it can't change
+        while the user is holding the mouse down over a dockable.
+        """
+
+        self._drag_pointer_pos = None
+        """The (x, y) position of the mouse relative to the screen as of the latest drag event."""
+
         self._grid_state = GridState(width, height)
         """Stores/manages which cells are populated."""
 
-        self._dockables = {}
+        self._dockable_index = {}
+        """
+        A dictionary associating each ``DockableMixin`` registered to this grid with its index into ``Grid._dockables``
+        and the parallel lists below.
+        """
+
+        self._dockables = []
+        """All the ``DockableMixin``s registered to this grid."""
+
+        self._ids = []
+        """The canvas item id of each dockable in ``Grid._dockables``."""
+
+        self._cells = []
+        """The top-left ``Cell`` of each dockable in ``Grid._dockables``."""
+
+        self._col_spans = []
         """
-        A dictionary whose keys are all the ``DockableMixin``s registered to this grid and whose values are
-        ``DockableEntry``s.
+        The column span each dockable in ``Grid._dockables`` had when it was placed. This is what its cells in the grid
+        state were populated with, even if ``DockableMixin.col_span`` has since changed.
         """
 
+        self._row_spans = []
+        """
+        The row span each dockable in ``Grid._dockables`` had when it was placed. This is what its cells in the grid
+        state were populated with, even if ``DockableMixin.row_span`` has since changed.
+        """
+
+        self._bboxes = []
+        """
+        The (x, y, width, height) bbox last applied to the canvas item of each dockable in ``Grid._dockables``. Used to
+        skip redundant canvas updates in ``Grid._update_dockable_geometry``.
+        """
+
+        self._geometry = None
+        """The grid's current ``GridGeometry``. This should only be set through the ``Grid.geometry`` property."""
+
+        self._col_stride = None
+        """The distance in pixels between the left edges of adjacent columns. Kept up to date by ``Grid.geometry``."""
+
+        self._row_stride = None
+        """The distance in pixels between the top edges of adjacent rows. Kept up to date by ``Grid.geometry``."""
+
         self.geometry = GridGeometry(width, height, cell_width, cell_height, column_padding, row_padding)
-        """The grid's current ``GridGeometry``."""
 
         self.orig_geometry = self.geometry
         """Stores the geometry (as a ``GridGeometry``) before any changes from window resizing are made."""
@@ -531,8 +755,8 @@ class Grid(ScrollCanvas):
 
         self._resize_after_id = None
         """
-        Stores the callback id for ``Grid._resize_after_callback`` so it may be cancelled when the
-        ``Grid.resize_protocol`` changes.
+        Stores the callback id for ``Grid._resize_after_callback`` while one is scheduled, so that bursts of resize
+        events are handled by a single callback and so it may be cancelled when the ``Grid.resize_protocol`` changes.
         """
 
         self.highlight_visual = highlight_visual
@@ -541,6 +765,18 @@ class Grid(ScrollCanvas):
         self.grid_visual = grid_visual
         """The current ``GridVisual`` for the grid drawn while a ``DockableMixin`` is dragged."""
 
+        self._gridline_geometry = None
+        """
+        The ``GridGeometry`` the grid rectangles on the canvas were drawn for, or None if they haven't been drawn yet.
+        The rectangles are only hidden between drags and are redrawn only when the geometry has since changed.
+        """
+
+        self._highlight_id = None
+        """
+        The canvas item id of the highlight rectangle, or None if it hasn't been created yet. The rectangle is only
+        hidden between uses and is otherwise moved into place.
+        """
+
         self.resize_protocol = None
         """
         An integer representing the protocol to employ when the parent window is resized such that the grid's canvas is
@@ -555,6 +791,25 @@ class Grid(ScrollCanvas):
 
         self.set_resize_protocol(resize_protocol)
 
+    @property
+    def geometry(self):
+        """
+        :return: The grid's current ``GridGeometry``.
+        :rtype: GridGeometry
+        """
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry):
+        """
+        :param geometry: The grid's new ``GridGeometry``.
+        :type geometry: GridGeometry
+        """
+        self._geometry = geometry
+        # Nearly every geometric calculation needs the column and row strides, so work them out once here.
+        self._col_stride = geometry.cell_width + geometry.column_padding
+        self._row_stride = geometry.cell_height + geometry.row_padding
+
     def register_dockable(self, dockable):
         """
         Register a ``DockableMixin`` to be managed by this grid. Its tkinter parent must already be this grid.
@@ -583,19 +838,20 @@ class Grid(ScrollCanvas):
         :return: Whether or not the move was successful.
         :rtype: bool
         """
-        old_cell = self._dockables[dockable].cell
-        conflicts_array = self._grid_state.conflicts_where(cell, dockable.col_span, dockable.row_span)
-        # conflicts_indices stores all the indices of grid conflicts, if any, in columns.
-        conflicts_indices = np.vstack(np.where(conflicts_array))
-        # Loop over all the conflicts (if there are any) and assure that they take place in the dockable's previous
-        # position, since it's being removed anyway so these conflicts are irrelevant. If any of the conflicts are
-        # "genuine", this conditional will not succeed and no changes are made.
-        if all(self._contained_in(Cell(idx[1], idx[0]), old_cell, dockable.col_span, dockable.row_span)
-               for idx in conflicts_indices.T):
-            self.remove_dockable(dockable)
-            self._place_dockable(dockable, cell)
-            return True
-        return False
+        idx = self._dockable_index[dockable]
+        old_cell = self._cells[idx]
+        old_col_span = self._col_spans[idx]
+        old_row_span = self._row_spans[idx]
+        # Temporarily clear the dockable's previous position while checking for conflicts, since it's being removed
+        # anyway so any conflicts there are irrelevant.
+        self._grid_state.unpopulate(old_cell, old_col_span, old_row_span)
+        conflicts = self._grid_state.conflicts(cell, dockable.col_span, dockable.row_span)
+        self._grid_state.populate(old_cell, old_col_span, old_row_span)
+        if conflicts:
+            return False
+        self.remove_dockable(dockable)
+        self._place_dockable(dockable, cell)
+        return True
 
     def dockable_resized(self, dockable):
         """
@@ -607,7 +863,7 @@ class Grid(ScrollCanvas):
         :param dockable: The dockable that has been resized.
         :type dockable: DockableMixin
         """
-        old_cell = self._dockables[dockable].cell
+        old_cell = self._cells[self._dockable_index[dockable]]
         self.remove_dockable(dockable)
         cell = self._find_next_empty_cell_group(dockable.col_span, dockable.row_span, old_cell)
         self._place_dockable(dockable, cell)
@@ -615,8 +871,8 @@ class Grid(ScrollCanvas):
     def _place_dockable(self, dockable, cell):
         """
         Internal method to place the ``DockableMixin`` ``dockable`` at the given ``Cell`` ``cell``, populate the
-        ``Grid._grid_state`` appropriately, and add the ``dockable`` to the ``Grid._dockables`` dictionary. This method
-        does not check for grid conflicts.
+        ``Grid._grid_state`` appropriately, and add the ``dockable`` to ``Grid._dockables`` (and the lists parallel to
+        it). This method does not check for grid conflicts.
 
         :param dockable: The dockable to place.
         :type dockable: DockableMixin
@@ -624,9 +880,15 @@ class Grid(ScrollCanvas):
         :type cell: Cell
         """
         self._grid_state.populate(cell, dockable.col_span, dockable.row_span)
-        bbox = self._calc_bbox(cell, dockable.col_span, dockable.row_span)
-        id_ = self.create_window(bbox.x, bbox.y, width=bbox.w, height=bbox.h, anchor=tk.NW, window=dockable)
-        self._dockables[dockable] = DockableEntry(id_, cell)
+        x, y, w, h = self._calc_bbox(cell, dockable.col_span, dockable.row_span)
+        id_ = self.create_window(x, y, width=w, height=h, anchor=tk.NW, window=dockable)
+        self._dockable_index[dockable] = len(self._dockables)
+        self._dockables.append(dockable)
+        self._ids.append(id_)
+        self._cells.append(cell)
+        self._col_spans.append(dockable.col_span)
+        self._row_spans.append(dockable.row_span)
+        self._bboxes.append((x, y, w, h))
 
     def remove_dockable(self, dockable):
         """
@@ -636,9 +898,19 @@ class Grid(ScrollCanvas):
         :param dockable: The dockable to remove.
         :type dockable: DockableMixin
         """
-        id_, cell = self._dockables.pop(dockable)
+        idx = self._dockable_index.pop(dockable)
+        id_ = self._ids[idx]
+        cell = self._cells[idx]
+        col_span = self._col_spans[idx]
+        row_span = self._row_spans[idx]
+        # Keep the lists dense by moving the last dockable into the vacated index.
+        for entries in (self._dockables, self._ids, self._cells, self._col_spans, self._row_spans, self._bboxes):
+            entries[idx] = entries[-1]
+            entries.pop()
+        if idx < len(self._dockables):
+            self._dockable_index[self._dockables[idx]] = idx
         self.delete(id_)
-        self._grid_state.unpopulate(cell, dockable.col_span, dockable.row_span)
+        self._grid_state.unpopulate(cell, col_span, row_span)
 
     def _calc_bbox(self, cell, col_span, row_span):
         """
@@ -650,14 +922,15 @@ class Grid(ScrollCanvas):
         :type col_span: int
         :param row_span: The height of the box in cells.
         :type row_span: int
-        :return: The calculated bbox.
-        :rtype: BBox
+        :return: The calculated bbox as an (x, y, width, height) tuple.
+        :rtype: tuple
         """
-        x = cell.column * (self.geometry.cell_width + self.geometry.column_padding)
-        y = cell.row * (self.geometry.cell_height + self.geometry.row_padding)
-        w = col_span * self.geometry.cell_width + (col_span - 1) * self.geometry.column_padding
-        h = row_span * self.geometry.cell_height + (row_span - 1) * self.geometry.row_padding
-        return BBox(x, y, w, h)
+        x = cell.column * self._col_stride
+        y = cell.row * self._row_stride
+        # Each box spans one less padding than it does cells.
+        w = col_span * self._col_stride - self._geometry.column_padding
+        h = row_span * self._row_stride - self._geometry.row_padding
+        return x, y, w, h
 
     def _find_next_empty_cell_group(self, col_span, row_span, from_=Cell(0, 0)):
         """
@@ -688,12 +961,10 @@ class Grid(ScrollCanvas):
         # First, determine if the height must be increased.
         new_height = row_span if row_span > self.geometry.height else None
         # coln will refer to how many columns at the right side of the grid are empty for at least the first row_span
-        # rows. This way, we need only expand the grid by col_span - coln. How the below line achieves this is left as a
-        # challenge to the reader :)
-        try:
-            coln = np.where(self._grid_state[:row_span, ::-1].sum(axis=0) == 0)[0].min() + 1
-        except ValueError:
-            coln = 0
+        # rows. This way, we need only expand the grid by col_span - coln. Note the clamp to col_span: the search may
+        # fail for want of height alone, in which case more than col_span columns may be empty, but the grid mustn't
+        # shrink.
+        coln = min(self.geometry.width - self._grid_state[:row_span].min_width, col_span)
         # Expand the grid according to the newly found width and height.
         self.set_geometry(self.geometry.width + col_span - coln, new_height)
         return Cell(self.geometry.width - col_span, 0)
@@ -715,41 +986,45 @@ class Grid(ScrollCanvas):
         :type: Cell
         """
         col, row = origin_cell
-        lco = -col  # Lower Column Offset limit
-        uco = self.geometry.width - col - col_span  # Upper Column Offset limit
-        lro = -row  # Lower Row Offset limit
-        uro = self.geometry.height - row - row_span  # Upper Row Offset limit
-        # Gradually increase the search radius, mag(nitude). mag = 0 corresponds to the origin_cell itself; mag = 1
-        # corresponds to the 8 cells around the origin cell; mag = 2 corresponds to the 16 cells around those 8 cells;
-        # etc.
-        for mag in range(max(self.geometry.width - col, self.geometry.height - row, col + 1, row + 1)):
-            # This generates all the valid offsets from the origin_cell as (c, r) two-tuples for a given mag.
-            offsets = ((c, r) for c in range(-mag, mag + 1) for r in range(-mag, mag + 1)
-                       if abs(c) + abs(r) >= mag if lco <= c <= uco if lro <= r <= uro)
-            # Sort the offsets based on their absolute sum so that we can return the nearest group of cells.
-            for c_offset, r_offset in sorted(offsets, key=lambda o: abs(o[0]) + abs(o[1])):
-                candidate = Cell(col + c_offset, row + r_offset)
-                # Only return the candidate cell if it has no grid conflicts
-                if not self._grid_state.conflicts(candidate, col_span, row_span):
-                    return candidate
-
-    def signal_drag_start(self, dockable):
+        # Find every conflict-free placement at once rather than probing candidates one at a time.
+        rows, cols = np.nonzero(self._grid_state.placements(col_span, row_span, self.geometry.width))
+        if not rows.size:
+            return None
+        # Pick the nearest placement, breaking ties in favour of the left-most and then the top-most one.
+        nearest = np.lexsort((rows, cols, np.abs(cols - col) + np.abs(rows - row)))[0]
+        return Cell(int(cols[nearest]), int(rows[nearest]))
+
+    def signal_drag_start(self, dockable, event=None):
         """
         Called by the ``DockableMixin`` dockable widget to signal that it is being dragged.
 
         :param dockable: The dockable who's being dragged.
         :type dockable: DockableMixin
+        :param event: The tkinter event which started the drag, if any. If omitted, the mouse position is queried.
+        :type event: tkinter.Event
         """
+        self._drag_root_pos = (self.winfo_rootx(), self.winfo_rooty())
+        self._set_drag_pointer_pos(event)
         self._draw_grid()
         self._curr_dockable = dockable
-        self._curr_dockable_orig_cell = self._dockables[dockable].cell
+        self._curr_dockable_orig_cell = self._cells[self._dockable_index[dockable]]
         self.remove_dockable(dockable)
-        # Despite the user not actually moving the mouse, call signal_drag_motion so that the highlight appears on the
+        # Despite the user not actually moving the mouse, update the drag position so that the highlight appears on the
         # grid.
-        self.signal_drag_motion()
+        self._update_drag_position()
 
-    def signal_drag_stop(self):
-        """Called by a ``DockableMixin`` widget to signal that it has stopped being dragged."""
+    def signal_drag_stop(self, event=None):
+        """
+        Called by a ``DockableMixin`` widget to signal that it has stopped being dragged.
+
+        :param event: The tkinter event which stopped the drag, if any.
+        :type event: tkinter.Event
+        """
+        # Apply any motion that hasn't been handled yet so the dockable lands where the mouse was released.
+        if self._drag_motion_after_id:
+            self.after_cancel(self._drag_motion_after_id)
+            self._set_drag_pointer_pos(event)
+            self._update_drag_position()
         self._clear_grid()
         self._clear_highlight()
         if self._curr_cell:
@@ -762,56 +1037,66 @@ class Grid(ScrollCanvas):
             self._place_dockable(self._curr_dockable, self._curr_dockable_orig_cell)
         self._curr_dockable = None
         self._curr_dockable_orig_cell = None
+        self._drag_root_pos = None
+        self._drag_pointer_pos = None
 
-    def signal_drag_motion(self):
-        """Called by a ``DockableMixin`` widget currently being dragged to signal that the mouse has moved."""
+    def signal_drag_motion(self, event=None):
+        """
+        Called by a ``DockableMixin`` widget currently being dragged to signal that the mouse has moved. The drag
+        position is updated once tkinter is idle (i.e. all pending events have been processed), so any number of motion
+        events in between only result in a single update.
+
+        :param event: The tkinter motion event, if any. If omitted, the mouse position is queried.
+        :type event: tkinter.Event
+        """
         # TODO: This method needn't be called from DockableMixin any more; we can bind to it in signal_drag_start.
-        self._clear_highlight()
-        self._curr_cell = None
+        self._set_drag_pointer_pos(event)
+        if not self._drag_motion_after_id:
+            self._drag_motion_after_id = self.after_idle(self._update_drag_position)
+
+    def _set_drag_pointer_pos(self, event):
+        """
+        Internal method to record the mouse position relative to the screen from the given tkinter event, or by querying
+        tkinter if ``event`` is None.
+
+        :param event: The tkinter event carrying the mouse position, if any.
+        :type event: tkinter.Event
+        """
+        if event is None:
+            self._drag_pointer_pos = self.winfo_pointerxy()
+        else:
+            self._drag_pointer_pos = (event.x_root, event.y_root)
+
+    def _update_drag_position(self):
+        """
+        Internal method to find the cell group nearest the mouse which the ``DockableMixin`` currently being dragged
+        could be placed in and highlight it.
+        """
+        self._drag_motion_after_id = None
 
         # Find the cell over which the cursor has moved to.
         # Note the calls to canvasx and canvasy; these are necessary since the canvas is scrollable and the mouse_x and
-        # mouse_y coordinates are relative to the root window, not the canvas.
-        mouse_x = self.winfo_pointerx() - self.winfo_rootx()
-        mouse_y = self.winfo_pointery() - self.winfo_rooty()
-        col, row = self._find_nearest_cell(self.canvasx(mouse_x), self.canvasy(mouse_y))
+        # mouse_y coordinates are relative to the grid's window, not the canvas.
+        mouse_x = self._drag_pointer_pos[0] - self._drag_root_pos[0]
+        mouse_y = self._drag_pointer_pos[1] - self._drag_root_pos[1]
+        col = int(self.canvasx(mouse_x) / self._col_stride)
+        row = int(self.canvasy(mouse_y) / self._row_stride)
         # Alias the col and row span for conciseness.
         col_span = self._curr_dockable.col_span
         row_span = self._curr_dockable.row_span
 
         # If the column and row are too big or too small (i.e. the dockable wouldn't fit in the grid at this cell
         # regardless of grid conflicts), clamp them down to the maximums/minimums.
-        max_col = self.geometry.width - col_span
-        if col > max_col:
-            col = max_col
-        elif col < 0:
-            col = 0
-        max_row = self.geometry.height - row_span
-        if row > max_row:
-            row = max_row
-        elif row < 0:
-            row = 0
+        col = min(max(col, 0), self.geometry.width - col_span)
+        row = min(max(row, 0), self.geometry.height - row_span)
         # Note that this search should never return None since the dockable can at least return to its previous
         # position.
         cell = self._naive_search(Cell(col, row), col_span, row_span)
 
-        self._set_highlight(cell, col_span, row_span)
-        self._curr_cell = cell
-
-    def _find_nearest_cell(self, x, y):
-        """
-        Internal method to find the ``Cell`` nearest to the given ``x`` and ``y`` coordinates relative to the canvas.
-
-        :param x: The x coordinate relative to the canvas.
-        :type x: int
-        :param y: The y coordinate relative to the canvas.
-        :type y: int
-        :return: The closest cell.
-        :rtype: Cell
-        """
-        col = x / (self.geometry.cell_width + self.geometry.column_padding)
-        row = y / (self.geometry.cell_height + self.geometry.row_padding)
-        return Cell(int(col), int(row))
+        # Most motion doesn't leave the current cell group, in which case the highlight is already in the right place.
+        if cell != self._curr_cell:
+            self._set_highlight(cell, col_span, row_span)
+            self._curr_cell = cell
 
     def set_geometry(self, width=None, height=None,
                      cell_width=None, cell_height=None,
@@ -845,38 +1130,33 @@ class Grid(ScrollCanvas):
         :return: The new ``GridGeometry`` object.
         :rtype: GridGeometry
         """
-        # Boolean to indicate if the dockables' geometries must be recalculated.
-        invalid_dockable_geom = False
-        if cell_width or cell_height or column_padding or row_padding:
-            invalid_dockable_geom = True
-
-        # Boolean to indicate if the grid state must be recalculated.
-        invalid_state_size = False
-        if width or height:
-            invalid_state_size = True
-
-        # Since polling the min width and height is somewhat expensive, we only do it if a new width or height is
-        # actually given.
-        if width and width < self._grid_state.min_width:
-            width = self._grid_state.min_width
-        if height and height < self._grid_state.min_height:
-            height = self._grid_state.min_height
-        # Notice the use of "or" here so that width and height may not be zero by accident.
-        width = width or self.geometry.width
-        height = height or self.geometry.height
-
-        cell_width = self._clamp(cell_width or self.geometry.cell_width, self.MIN_CELL_WIDTH)
-        cell_height = self._clamp(cell_height or self.geometry.cell_height, self.MIN_CELL_HEIGHT)
+        # Unpack the current geometry once rather than going through the namedtuple for every fallback below.
+        curr_width, curr_height, curr_cell_width, curr_cell_height, curr_column_padding, curr_row_padding = \
+            self.geometry
+
+        # Since polling the min width and height is somewhat expensive, we only do it (once each) if a new width or
+        # height is actually given. Notice zero is treated like None here so that width and height may not be zero by
+        # accident.
+        width = curr_width if not width else max(width, self._grid_state.min_width)
+        height = curr_height if not height else max(height, self._grid_state.min_height)
+
+        cell_width = self._clamp(cell_width or curr_cell_width, self.MIN_CELL_WIDTH)
+        cell_height = self._clamp(cell_height or curr_cell_height, self.MIN_CELL_HEIGHT)
 
         # Notice the None checks instead of simply "or": the paddings are allow to be zero.
-        column_padding = self.geometry.column_padding if column_padding is None else column_padding
-        row_padding = self.geometry.row_padding if row_padding is None else row_padding
+        column_padding = curr_column_padding if column_padding is None else column_padding
+        row_padding = curr_row_padding if row_padding is None else row_padding
+
+        # Only recalculate the grid state and the dockables' geometries if something they depend on actually changed,
+        # so that no-op calls stay cheap.
+        invalid_state_size = (width, height) != (curr_width, curr_height)
+        invalid_dockable_geom = (cell_width, cell_height, column_padding, row_padding) != \
+            (curr_cell_width, curr_cell_height, curr_column_padding, curr_row_padding)
 
         self.orig_geometry = self.geometry = GridGeometry(width, height,
                                                           cell_width, cell_height,
                                                           column_padding, row_padding)
-        self.resize_scroll_region(self.geometry.width * (self.geometry.cell_width + self.geometry.column_padding),
-                                  self.geometry.height * (self.geometry.cell_height + self.geometry.row_padding))
+        self.resize_scroll_region(width * self._col_stride, height * self._row_stride)
         if invalid_state_size:
             self._update_state_size(width, height)
         if invalid_dockable_geom:
@@ -898,22 +1178,40 @@ class Grid(ScrollCanvas):
         :param height: The new height.
         :type height: int
         """
-        self._grid_state = GridState(width, height)
-        # Repopulate the state with all the dockables.
-        for dockable, (_, cell) in self._dockables.items():
-            self._grid_state.populate(cell, dockable.col_span, dockable.row_span)
+        grid_state = GridState(width, height)
+        # Copy over the overlap rather than repopulating the state with every dockable. set_geometry never shrinks the
+        # grid past the state's minimum width and height, so nothing populated lies outside the overlap.
+        rows = min(grid_state.shape[0], self._grid_state.shape[0])
+        words = min(grid_state.shape[1], self._grid_state.shape[1])
+        grid_state[:rows, :words] = self._grid_state[:rows, :words]
+        self._grid_state = grid_state
 
     def _update_dockable_geometry(self):
         """
         Update the geometry of each ``DockableMixin`` managed by this grid.
         """
-        for dockable, (id_, cell) in self._dockables.items():
-            bbox = self._calc_bbox(cell, dockable.col_span, dockable.row_span)
-            # Reset the size.
-            self.itemconfig(id_, width=bbox.w, height=bbox.h)
-            old_x, old_y = self.coords(id_)
-            # Reset the position.
-            self.move(id_, bbox.x - old_x, bbox.y - old_y)
+        # Every dockable is updated in bulk (e.g. on each resize callback), so rather than making separate Tcl calls to
+        # reset each one's size and position, build all the canvas commands into one script and evaluate it at once.
+        if not self._dockables:
+            return
+        # Compute every dockable's bbox at once from the parallel cell and span lists; this is equivalent to calling
+        # Grid._calc_bbox on each of them. Dockables whose bbox hasn't actually changed (e.g. when the cell size only
+        # changes by a fraction of a pixel) are then skipped entirely.
+        strides = np.array((self._col_stride, self._row_stride))
+        paddings = np.array((self._geometry.column_padding, self._geometry.row_padding))
+        xys = np.array(self._cells) * strides
+        whs = np.column_stack((self._col_spans, self._row_spans)) * strides - paddings
+        script = []
+        bboxes = self._bboxes
+        for idx, (id_, bbox) in enumerate(zip(self._ids, map(tuple, np.hstack((xys, whs)).tolist()))):
+            if bboxes[idx] == bbox:
+                continue
+            bboxes[idx] = bbox
+            x, y, w, h = bbox
+            script.append("{} itemconfigure {} -width {} -height {}".format(self._w, id_, w, h))
+            script.append("{} coords {} {} {}".format(self._w, id_, x, y))
+        if script:
+            self.tk.eval("\n".join(script))
 
     def set_resize_protocol(self, protocol):
         """
@@ -924,12 +1222,13 @@ class Grid(ScrollCanvas):
         """
         self.resize_protocol = protocol
         self.geometry = self.orig_geometry
+        if self._resize_after_id:
+            # Cancel a resize callback, should one exist, since the changed resize_protocol would mess it up.
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
         if protocol == self.RESIZE_PROTO_NONE:
             self.unbind("<Configure>")
-            if self._resize_data:
-                # Cancel a resize callback, should one exist, since the changed resize_protocol would mess it up.
-                self.after_cancel(self._resize_after_id)
-                self._resize_after_id = None
+            self._resize_data = None
             # Update the dockable geometry in case the protocol was changed while the window is expanded.
             self._update_dockable_geometry()
         else:
@@ -953,6 +1252,7 @@ class Grid(ScrollCanvas):
         bd_colour = bd_colour or self.highlight_visual.bd_colour
         fill = fill or self.highlight_visual.fill
         self.highlight_visual = HighlightVisual(bd_width, bd_colour, fill)
+        self.itemconfigure(self.TAG_HIGHLIGHT, width=bd_width, outline=bd_colour, fill=fill)
 
     def set_grid_visual(self, width=None, colour=None):
         """
@@ -966,25 +1266,36 @@ class Grid(ScrollCanvas):
         width = width or self.grid_visual.width
         colour = colour or self.grid_visual.colour
         self.grid_visual = GridVisual(width, colour)
+        self.itemconfigure(self.TAG_GRIDLINE, width=width, outline=colour)
 
     def _draw_grid(self):
-        """Draw the grid rectangles on the canvas. One rectangle is drawn for each cell."""
-        # TODO: The grid rectangles needn't be redrawn every time; they could be cached and invalidated when geometry is reset.
-        # The number of pixels between each cell in the x direction.
-        dx = self.geometry.cell_width + self.geometry.column_padding
-        # The number of pixels between each cell in the y direction.
-        dy = self.geometry.cell_height + self.geometry.row_padding
-        for x in range(0, self.geometry.width * dx, dx):
-            for y in range(0, self.geometry.height * dy, dy):
-                self.create_rectangle(x, y, x + self.geometry.cell_width, y + self.geometry.cell_height,
-                                      width=self.grid_visual.width,
-                                      outline=self.grid_visual.colour,
-                                      fill="",
-                                      tag=self.TAG_GRIDLINE)
+        """
+        Show the grid rectangles on the canvas. One rectangle is drawn for each cell. The rectangles from the previous
+        drag are reused unless the geometry has changed since.
+        """
+        if self._gridline_geometry == self.geometry:
+            self.itemconfigure(self.TAG_GRIDLINE, state=tk.NORMAL)
+            return
+        self.delete(self.TAG_GRIDLINE)
+        self._gridline_geometry = self.geometry
+        width, height, cell_width, cell_height = self.geometry[:4]
+        # There's one rectangle per cell, so rather than a Tcl call for each, build all the create commands into one
+        # script and evaluate it at once. The colour is braced since Tk colour names may contain spaces.
+        options = "-width {} -outline {{{}}} -fill {{}} -tags {}".format(self.grid_visual.width,
+                                                                         self.grid_visual.colour,
+                                                                         self.TAG_GRIDLINE)
+        script = []
+        for x in range(0, width * self._col_stride, self._col_stride):
+            for y in range(0, height * self._row_stride, self._row_stride):
+                script.append("{} create rectangle {} {} {} {} {}".format(self._w, x, y,
+                                                                          x + cell_width, y + cell_height, options))
+        self.tk.eval("\n".join(script))
+        # Keep the grid beneath the highlight rectangle, which may have been created before it.
+        self.tag_lower(self.TAG_GRIDLINE)
 
     def _clear_grid(self):
-        """Clear the grid lines on the canvas, should they exist."""
-        self.delete(self.TAG_GRIDLINE)
+        """Hide the grid lines on the canvas, should they exist."""
+        self.itemconfigure(self.TAG_GRIDLINE, state=tk.HIDDEN)
 
     def _set_highlight(self, cell, col_span, row_span):
         """
@@ -999,34 +1310,41 @@ class Grid(ScrollCanvas):
         :type row_span: int
         """
         x, y, w, h = self._calc_bbox(cell, col_span, row_span)
-        # Draw the rectangle. The +- constants on each coordinate was empirically determined to produce the best-looking
-        # rectangle within the grid lines.
-        self.create_rectangle(x + 2, y + 2, x + w - 1, y + h - 1,
-                              width=self.highlight_visual.bd_width,
-                              outline=self.highlight_visual.bd_colour,
-                              fill=self.highlight_visual.fill,
-                              tag=self.TAG_HIGHLIGHT)
+        # The +- constants on each coordinate was empirically determined to produce the best-looking rectangle within
+        # the grid lines.
+        coords = (x + 2, y + 2, x + w - 1, y + h - 1)
+        if self._highlight_id is None:
+            self._highlight_id = self.create_rectangle(*coords,
+                                                       width=self.highlight_visual.bd_width,
+                                                       outline=self.highlight_visual.bd_colour,
+                                                       fill=self.highlight_visual.fill,
+                                                       tag=self.TAG_HIGHLIGHT)
+        else:
+            # Move the existing rectangle into place rather than creating a new one.
+            self.coords(self._highlight_id, *coords)
+            self.itemconfigure(self._highlight_id, state=tk.NORMAL)
 
     def _clear_highlight(self):
-        """Clear the highlight rectangle on the canvas, should it exist."""
-        self.delete(self.TAG_HIGHLIGHT)
+        """Hide the highlight rectangle on the canvas, should it exist."""
+        self.itemconfigure(self.TAG_HIGHLIGHT, state=tk.HIDDEN)
 
     def _resize_bind_callback(self, event):
         """
         A callback for resize events. Instead of resetting the geometry (which is somewhat expensive) upon every resize
-        event, we schedule a callback to ``Grid._resize_after_callback`` every ``Grid.RESIZE_UPDATE_DELAY``
-        milliseconds, but cache the new width and height every resize event.
+        event, we schedule a callback to ``Grid._resize_after_callback`` for when tkinter is idle (i.e. all pending
+        events have been processed), but cache the new width and height every resize event.
 
         :param event: The tk event object.
         """
-        # Only schedule a callback if one isn't already scheduled (_resize_data is None when no callback is scheduled.)
-        if not self._resize_data:
-            self._resize_after_id = self.after(self.RESIZE_UPDATE_DELAY, self._resize_after_callback)
-        # Always, however, update _resize_data with the new width and height from the event.
+        # Always update _resize_data with the new width and height from the event.
         self._resize_data = Size(event.width, event.height)
+        # Only schedule a callback if one isn't already scheduled.
+        if not self._resize_after_id:
+            self._resize_after_id = self.after_idle(self._resize_after_callback)
 
     def _resize_after_callback(self):
-        """Called every ``Grid.RESIZE_UPDATE_DELAY`` if the user is actively changing the size of the parent window."""
+        """Called once tkinter is idle after the user has changed the size of the parent window."""
+        self._resize_after_id = None
         # Whether the geometry in the x direction should change.
         resize_x = self._should_resize_x()
         # Whether the geometry in the y direction should change.
@@ -1057,16 +1375,19 @@ class Grid(ScrollCanvas):
                     self.set_resize_protocol(self.RESIZE_PROTO_NONE)
                     raise ValueError("invalid resize protocol; setting resize protocol to RESIZE_PROTO_NONE")
 
-            self.geometry = GridGeometry(w, h, cw, ch, cp, rp)
-            self._update_dockable_geometry()
+            geometry = GridGeometry(w, h, cw, ch, cp, rp)
+            # Resizing the window by less than a cell's worth of pixels per cell leaves the geometry as is, in which
+            # case there's nothing to redraw.
+            if geometry != self.geometry:
+                self.geometry = geometry
+                self._update_dockable_geometry()
         # If neither the x or y directions need to be changed according to the window size, make sure the orig_geometry
         # (i.e. the geometry originally set manually by the user) is in use.
         elif self.geometry != self.orig_geometry:
             self.geometry = self.orig_geometry
             self._update_dockable_geometry()
 
-        # Set _resize_data to None to indicate that the data in it has been applied to the grid's geometry and now a new
-        # callback to this method may be scheduled.
+        # Set _resize_data to None to indicate that the data in it has been applied to the grid's geometry.
         self._resize_data = None
 
     def _should_resize_x(self):
@@ -1077,7 +1398,7 @@ class Grid(ScrollCanvas):
         # The x scroll bar will be maxed out if the space allocated to the grid is greater than the width of the
         # scrollregion, and hence this may be used as an indicator for when the grid should be resized in the x
         # direction in accordance with the window size.
-        return self.x_scrollbar.get() == self.MAX_SCROLLBAR_POS
+        return self._x_at_max
 
     def _should_resize_y(self):
         """
@@ -1087,28 +1408,7 @@ class Grid(ScrollCanvas):
         # The y scroll bar will be maxed out if the space allocated to the grid is greater than the height of the
         # scrollregion, and hence this may be used as an indicator for when the grid should be resized in the y
         # direction in accordance with the window size.
-        return self.y_scrollbar.get() == self.MAX_SCROLLBAR_POS
-
-    @staticmethod
-    def _contained_in(query_cell, containing_cell, col_span, row_span):
-        """
-        Check whether ``query_cell`` is contained in the rectangle described by ``containing_cell``, ``col_span``,
-        and ``row_span``.
-
-        :param query_cell: The cell to check for containment in the rectangle.
-        :type query_cell: Cell
-        :param containing_cell: The top-left cell in the rectangle.
-        :type containing_cell: Cell
-        :param col_span: The width in cells of the rectangle.
-        :type col_span: int
-        :param row_span: The height in cells of the rectangle.
-        :type row_span: int
-        :return: Whether ``query_cell`` is in the rectangle described by the given information.
-        :rtype: bool
-        """
-        col, row = query_cell
-        ccol, crow = containing_cell
-        return col in range(ccol, ccol + col_span) and row in range(crow, crow + row_span)
+        return self._y_at_max
 
     @staticmethod
     def _clamp(n, min_):
@@ -1225,10 +1525,10 @@ class DockableMixin:
 
         :param widget: The widget to bind the right click events to.
         """
-        # lambdas are used here to ignore the event objects passed by tkinter.
-        widget.bind("<Button-3>", lambda _: self.parent_grid.signal_drag_start(self))
-        widget.bind("<ButtonRelease-3>", lambda _: self.parent_grid.signal_drag_stop())
-        widget.bind("<B3-Motion>", lambda _: self.parent_grid.signal_drag_motion())
+        # The event objects are passed through so the grid can read the mouse position off them rather than querying it.
+        widget.bind("<Button-3>", lambda event: self.parent_grid.signal_drag_start(self, event))
+        widget.bind("<ButtonRelease-3>", lambda event: self.parent_grid.signal_drag_stop(event))
+        widget.bind("<B3-Motion>", lambda event: self.parent_grid.signal_drag_motion(event))
 
     @staticmethod
     def unbind_drag_on(widget):
@@ -1249,6 +1549,21 @@ class GuiManager:
     provides an asynchronous version of the tkinter mainloop.
     """
 
+    EVENT_FLAGS = _tkinter.ALL_EVENTS | _tkinter.DONT_WAIT
+    """The flags passed to ``dooneevent`` when pumping tkinter events from the asyncio event loop."""
+
+    MAX_EVENTS_PER_PUMP = 100
+    """
+    The most tkinter events processed per pump before yielding back to the asyncio event loop, so that a flood of
+    events can't starve other asyncio tasks.
+    """
+
+    MAX_IDLE_INTERVAL = 50
+    """
+    The longest (in milliseconds) the wait in between pumping tkinter events may back off to while the gui is idle,
+    unless the interval given to ``GuiManager.start_async`` is longer.
+    """
+
     def __init__(self, prog_name):
         """
         :param prog_name: The name to associate with the gui. This will be used in the title of all windows.
@@ -1261,6 +1576,15 @@ class GuiManager:
         # anything.
         self.root.withdraw()
 
+        self._root_destroyed = False
+        """
+        Whether the tkinter root has been destroyed. Processing tkinter events doesn't fail once the root is destroyed,
+        so this is how ``GuiManager._pump`` knows to stop.
+        """
+
+        # Note the "+" so as not to replace any other bindings on the root.
+        self.root.bind("<Destroy>", self._root_destroy_callback, "+")
+
         self.prog_name = prog_name
         """The name associated with the gui. This is used in the title of all windows."""
 
@@ -1270,24 +1594,173 @@ class GuiManager:
         title.
         """
 
+        self._windows_snapshot = ()
+        """A tuple of the values of ``GuiManager.windows``, rebuilt whenever a window is created or destroyed."""
+
+        self._next_win_num = 1
+        """The lowest window number which has never been used."""
+
+        self._free_win_nums = []
+        """
+        A min-heap of the window numbers below ``GuiManager._next_win_num`` which have been freed by destroyed windows.
+        """
+
+        self._executor = ThreadPoolExecutor(thread_name_prefix="spookyconsole-gui")
+        """The executor which runs the blocking functions given to ``GuiManager.run_blocking``."""
+
+        self._loop = None
+        """The asyncio event loop tkinter events are pumped from, if ``GuiManager.start_async`` has been called."""
+
+        self._min_interval = None
+        """The shortest (in seconds) the wait in between pumping tkinter events while the gui is idle may be."""
+
+        self._max_interval = None
+        """The longest (in seconds) the wait in between pumping tkinter events while the gui is idle may back off to."""
+
+        self._idle_interval = None
+        """How long to wait (in seconds) before pumping tkinter events next time the gui is found to be idle."""
+
+        self._pump_handle = None
+        """The asyncio handle for the next scheduled call to ``GuiManager._pump``."""
+
+        self._closed = None
+        """
+        An asyncio future which is finished when pumping tkinter events stops, i.e. once the tkinter root is destroyed,
+        a ``tkinter.TclError`` occurs, or ``GuiManager.stop_async`` is called. Its result is the ``tkinter.TclError``
+        that stopped it, if any, or otherwise None.
+        """
+
     async def async_mainloop(self, interval):
         """
-        An asynchronous version of the tkinter mainloop. This works by updating the tkinter root and then yielding
-        execution for the given interval.
+        An asynchronous version of the tkinter mainloop. This is a thin wrapper around ``GuiManager.start_async``
+        which waits for tkinter events to stop being pumped.
+
+        The loop ends once the tkinter root is destroyed. If a ``tkinter.TclError`` occurs, it is logged and the loop
+        is broken too.
+
+        Any asyncio event loop works, but see ``install_uvloop`` for a faster one.
+
+        Since the gui is only updated in between other asyncio tasks, any blocking (i.e. CPU-heavy or synchronous I/O)
+        work done in them freezes the gui. Use ``GuiManager.run_blocking`` for such work.
+
+        :param interval: How long to wait for (in milliseconds) in between updates while the gui is idle.
+        :type interval: int
+        """
+        try:
+            await self.start_async(interval)
+        finally:
+            self.stop_async()
 
-        If a ``tkinter.TclError`` occurs, it is printed out and the loop is broken.
+    def start_async(self, interval, loop=None):
+        """
+        Start pumping tkinter events from the given asyncio event loop. This works by processing all pending tkinter
+        events and then rescheduling itself on the event loop via ``call_soon``/``call_later``, so no coroutine is
+        involved. If any events were processed, the next pump is scheduled immediately so that bursts of events (e.g.
+        dragging) are handled without delay; otherwise it is scheduled after a wait which starts at the given interval
+        and doubles for each consecutive idle pump, up to ``GuiManager.MAX_IDLE_INTERVAL``.
 
-        :param interval: How long to sleep for (in milliseconds) in between updates.
+        :param interval: The shortest wait (in milliseconds) in between updates while the gui is idle.
         :type interval: int
+        :param loop: The asyncio event loop to use. Defaults to the running event loop.
+        :type loop: asyncio.AbstractEventLoop
+        :return: A future which is finished when pumping stops (see ``GuiManager.wait_closed``). Its result is the
+        ``tkinter.TclError`` that stopped it, if any.
+        :rtype: asyncio.Future
+        """
+        self.stop_async()
+        self._loop = loop or asyncio.get_running_loop()
+        self.set_interval(interval)
+        self._closed = self._loop.create_future()
+        self._pump_handle = self._loop.call_soon(self._pump)
+        return self._closed
+
+    async def wait_closed(self):
+        """
+        Wait for tkinter events to stop being pumped, i.e. until the tkinter root is destroyed, a ``tkinter.TclError``
+        occurs, or ``GuiManager.stop_async`` is called. Returns immediately if ``GuiManager.start_async`` hasn't been
+        called.
+
+        :return: The ``tkinter.TclError`` that stopped the pumping, if any.
+        :rtype: tkinter.TclError
         """
-        # Convert interval from milliseconds to seconds.
-        interval /= 1000
+        if self._closed:
+            return await self._closed
+
+    async def run_blocking(self, fn, *args):
+        """
+        Run the given blocking function in a worker thread so that it doesn't freeze the gui, and wait for it to
+        finish. The function mustn't call into tkinter.
+
+        :param fn: The function to run.
+        :param args: Args for ``fn``.
+        :return: Whatever ``fn`` returns.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def set_interval(self, interval):
+        """
+        Set the shortest wait in between pumping tkinter events while the gui is idle. This may be called while events
+        are being pumped.
+
+        :param interval: The shortest wait (in milliseconds) in between updates while the gui is idle.
+        :type interval: int
+        """
+        # Convert the intervals from milliseconds to seconds once here rather than on every pump.
+        self._min_interval = self._idle_interval = interval / 1000
+        self._max_interval = max(interval, self.MAX_IDLE_INTERVAL) / 1000
+
+    def stop_async(self):
+        """Stop pumping tkinter events, if ``GuiManager.start_async`` has been called."""
+        if self._pump_handle:
+            self._pump_handle.cancel()
+            self._pump_handle = None
+        if self._closed and not self._closed.done():
+            self._closed.set_result(None)
+
+    def _root_destroy_callback(self, event):
+        """
+        Internal method used as the callback for the root's "<Destroy>" events.
+
+        :param event: The tkinter event object.
+        """
+        # The root's bindings also fire for the destruction of each of its children, which are of no interest here.
+        if event.widget is self.root:
+            self._root_destroyed = True
+
+    def _pump(self):
+        """Internal method to process all pending tkinter events and schedule the next call to itself."""
+        if self._root_destroyed:
+            # Whether the root was destroyed by an event processed last pump (e.g. a window's close button) or from
+            # outside of the pump (e.g. by an asyncio task), stop here.
+            self._pump_handle = None
+            self._closed.set_result(None)
+            return
+        # Look these up once rather than on every iteration of the loop below.
+        dooneevent = self.root.tk.dooneevent
+        flags = self.EVENT_FLAGS
+        processed = False
         try:
-            while True:
-                self.root.update()
-                await asyncio.sleep(interval)
+            # Drain the pending events rather than just those that happened to be queued at the time of the call, but
+            # only up to a limit since event handlers may keep generating more.
+            for _ in range(self.MAX_EVENTS_PER_PUMP):
+                if not dooneevent(flags):
+                    break
+                processed = True
         except tk.TclError as e:
-            print("Tkinter error occurred:\n" + str(e))  # TODO: Temp?
+            _LOGGER.warning("Tkinter error occurred: %s", e)
+            self._pump_handle = None
+            self._closed.set_result(e)
+            return
+        if processed:
+            self._idle_interval = self._min_interval
+            self._pump_handle = self._loop.call_soon(self._pump)
+        elif not self._idle_interval:
+            # An interval of zero just yields to the event loop, which call_soon does without involving any timer.
+            self._pump_handle = self._loop.call_soon(self._pump)
+        else:
+            self._pump_handle = self._loop.call_later(self._idle_interval, self._pump)
+            # Back off while the gui stays idle.
+            self._idle_interval = min(self._idle_interval * 2, self._max_interval)
 
     def new_win(self, width, height, *args, **kwargs):
         """
@@ -1305,10 +1778,21 @@ class GuiManager:
         """
         win = Window(self.root, width, height, *args, **kwargs)
         num = self._get_next_win_num()
-        win.title(self.prog_name + " ({})".format(num))
+        win.title(f"{self.prog_name} ({num})")
         self.windows[num] = win
+        self._windows_snapshot = tuple(self.windows.values())
         return win, num
 
+    def iter_windows(self):
+        """
+        Get all the open windows. This is cheaper than going through ``GuiManager.windows`` since the result is only
+        rebuilt when a window is created or destroyed.
+
+        :return: The open windows.
+        :rtype: tuple
+        """
+        return self._windows_snapshot
+
     def _get_next_win_num(self):
         """
         Generate a unique window number (integer), starting at one.
@@ -1316,9 +1800,11 @@ class GuiManager:
         :return: The generated integer.
         :rtype: int
         """
-        n = 1
-        while n in self.windows:
-            n += 1
+        # The lowest freed number is reused first, so this always returns the lowest number not in use.
+        if self._free_win_nums:
+            return heapq.heappop(self._free_win_nums)
+        n = self._next_win_num
+        self._next_win_num += 1
         return n
 
     def destroy_win(self, n):
@@ -1329,3 +1815,5 @@ class GuiManager:
         :type n: int
         """
         self.windows.pop(n).destroy()
+        self._windows_snapshot = tuple(self.windows.values())
+        heapq.heappush(self._free_win_nums, n)
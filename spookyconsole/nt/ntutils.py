@@ -3,6 +3,7 @@
 TODO
 """
 
+from functools import lru_cache
 import click
 import pycmds
 from networktables.instance import NetworkTablesInstance
@@ -13,6 +14,15 @@ TRUE = ["true", "t"]
 FALSE = ["false", "f"]
 BOOLEAN_CONV_FAIL_MSG = "cannot convert {!r} to boolean"
 DOUBLE_CONV_FAIL_MSG = "cannot convert {!r} to double"
+TYPE_NAMES = {
+    NetworkTablesInstance.EntryTypes.BOOLEAN: "BOOLEAN",
+    NetworkTablesInstance.EntryTypes.DOUBLE: "DOUBLE",
+    NetworkTablesInstance.EntryTypes.STRING: "STRING",
+    NetworkTablesInstance.EntryTypes.RAW: "RAW",
+    NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY: "BOOLEAN_ARRAY",
+    NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY: "DOUBLE_ARRAY",
+    NetworkTablesInstance.EntryTypes.STRING_ARRAY: "STRING_ARRAY"
+}
 
 
 def str_to_bool(string):
@@ -26,56 +36,28 @@ def str_to_bool(string):
 
 
 def type_constant_to_str(kind):
-    if kind == NetworkTablesInstance.EntryTypes.BOOLEAN:
-        return "BOOLEAN"
-    elif kind == NetworkTablesInstance.EntryTypes.DOUBLE:
-        return "DOUBLE"
-    elif kind == NetworkTablesInstance.EntryTypes.STRING:
-        return "STRING"
-    elif kind == NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY:
-        return "BOOLEAN_ARRAY"
-    elif kind == NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY:
-        return "DOUBLE_ARRAY"
-    else:  # kind == NetworkTablesInstance.EntryTypes.STRING_ARRAY:
-        return "STRING_ARRAY"
+    # Anything unrecognized falls back to "STRING_ARRAY", as the former if/elif chain's final else branch did.
+    return TYPE_NAMES.get(kind, "STRING_ARRAY")
+
+
+def str_to_double(string):
+    try:
+        return float(string)
+    except ValueError:
+        raise ValueError(DOUBLE_CONV_FAIL_MSG.format(string))
 
 
 def type_cast(value, kind, ctx=None):
     try:
-        if kind == NetworkTablesInstance.EntryTypes.BOOLEAN:
-            return str_to_bool(value)
-        elif kind == NetworkTablesInstance.EntryTypes.DOUBLE:
-            try:
-                return float(value)
-            except ValueError:
-                raise ValueError(DOUBLE_CONV_FAIL_MSG.format(value))
-        elif kind == NetworkTablesInstance.EntryTypes.STRING:
-            return value
-        elif kind == NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY:
-            # TODO: manual invocation of convert seems a little hacky...
-            return BOOLEAN_ARRAY_TYPE.convert(value, None, ctx)
-        elif kind == NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY:
-            return DOUBLE_ARRAY_TYPE.convert(value, None, ctx)
-        else:  # kind == NetworkTablesInstance.EntryTypes.STRING_ARRAY
-            return STRING_ARRAY_TYPE.convert(value, None, ctx)
+        return _CONVERTERS.get(kind, _convert_string_array)(value, ctx)
     except click.BadParameter as e:
         raise ValueError(e)
 
 
-def set_entry_by_type(entry, value):
-    kind = entry.getType()
-    if kind == NetworkTablesInstance.EntryTypes.BOOLEAN:
-        return entry.setBoolean(value)
-    elif kind == NetworkTablesInstance.EntryTypes.DOUBLE:
-        return entry.setDouble(value)
-    elif kind == NetworkTablesInstance.EntryTypes.STRING:
-        return entry.setString(value)
-    elif kind == NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY:
-        return entry.setBooleanArray(value)
-    elif kind == NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY:
-        return entry.setDoubleArray(value)
-    else:  # kind == NetworkTablesInstance.EntryTypes.STRING_ARRAY
-        return entry.setStringArray(value)
+def set_entry_by_type(entry, value, kind=None):
+    if kind is None:
+        kind = entry.getType()
+    return getattr(entry, _SETTERS.get(kind, "setStringArray"))(value)
 
 
 class NTPath:
@@ -96,10 +78,13 @@ class NTPath:
         return not self.is_absolute
 
     def resolve_full_name(self, ctx):
+        return self.resolve_full_name_from(ctx.obj.nt_path)
+
+    def resolve_full_name_from(self, cwd):
         if self.is_absolute:
             ret = ""
         else:
-            ret = ctx.obj.nt_path
+            ret = cwd
             if not ret.endswith(NetworkTables.PATH_SEPARATOR):
                 ret += NetworkTables.PATH_SEPARATOR
         for component in self.path.split(NetworkTables.PATH_SEPARATOR):
@@ -118,11 +103,18 @@ class NTPath:
             raise ValueError("invalid NT path name")
 
 
+# Interactive sessions resolve the same few paths against the same working table over and over, and the result depends
+# only on those two strings, so it's cached. Since the working table is part of the key, cd needn't invalidate anything.
+@lru_cache(maxsize=256)
+def resolve_full_name(string_path, cwd):
+    return NTPath(string_path).resolve_full_name_from(cwd)
+
+
 class NTPathParamType(click.ParamType):
 
     def convert(self, value, param, ctx):
         try:
-            return NTPath(value).resolve_full_name(ctx)
+            return resolve_full_name(value, ctx.obj.nt_path)
         except ValueError as e:
             self.fail(str(e), param, ctx)
 
@@ -164,3 +156,27 @@ STRING_ARRAY_TYPE = pycmds.LIST
 NT_PATH_TYPE = NTPathParamType()
 NT_ENTRY_TYPE = NTEntryParamType()
 NT_TABLE_TYPE = NTTableParamType()
+
+
+# TODO: manual invocation of convert seems a little hacky...
+def _convert_string_array(value, ctx):
+    return STRING_ARRAY_TYPE.convert(value, None, ctx)
+
+
+# Dispatch tables used by type_cast and set_entry_by_type, built once rather than walking an if/elif chain per call.
+_CONVERTERS = {
+    NetworkTablesInstance.EntryTypes.BOOLEAN: lambda value, ctx: str_to_bool(value),
+    NetworkTablesInstance.EntryTypes.DOUBLE: lambda value, ctx: str_to_double(value),
+    NetworkTablesInstance.EntryTypes.STRING: lambda value, ctx: value,
+    NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY: lambda value, ctx: BOOLEAN_ARRAY_TYPE.convert(value, None, ctx),
+    NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY: lambda value, ctx: DOUBLE_ARRAY_TYPE.convert(value, None, ctx),
+    NetworkTablesInstance.EntryTypes.STRING_ARRAY: _convert_string_array
+}
+_SETTERS = {
+    NetworkTablesInstance.EntryTypes.BOOLEAN: "setBoolean",
+    NetworkTablesInstance.EntryTypes.DOUBLE: "setDouble",
+    NetworkTablesInstance.EntryTypes.STRING: "setString",
+    NetworkTablesInstance.EntryTypes.BOOLEAN_ARRAY: "setBooleanArray",
+    NetworkTablesInstance.EntryTypes.DOUBLE_ARRAY: "setDoubleArray",
+    NetworkTablesInstance.EntryTypes.STRING_ARRAY: "setStringArray"
+}
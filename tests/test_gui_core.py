@@ -0,0 +1,56 @@
+import asyncio
+import tkinter as tk
+import unittest
+from spookyconsole.gui import core
+
+
+def _make_root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise unittest.SkipTest("no display available: {}".format(e))
+    root.withdraw()
+    return root
+
+
+class _Dockable(core.DockableMixin, tk.Frame):
+    pass
+
+
+class GridExpansionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = _make_root()
+        self.addCleanup(self.root.destroy)
+
+    def test_dockable_taller_than_empty_grid_does_not_shrink_width(self):
+        grid = core.Grid(self.root, 5, 2)
+        dockable = _Dockable(grid, 2, 3)
+        grid.register_dockable(dockable)
+        self.assertEqual(grid.geometry.width, 5)
+        self.assertEqual(grid.geometry.height, 3)
+        self.assertEqual(grid._cells[grid._dockable_index[dockable]], core.Cell(3, 0))
+
+
+class GuiManagerAsyncTest(unittest.TestCase):
+
+    def test_wait_closed_returns_once_root_is_destroyed(self):
+        try:
+            manager = core.GuiManager("test")
+        except tk.TclError as e:
+            raise unittest.SkipTest("no display available: {}".format(e))
+
+        async def run():
+            mainloop = asyncio.ensure_future(manager.async_mainloop(1))
+            # Let the pump start before destroying the root.
+            await asyncio.sleep(0.05)
+            manager.root.destroy()
+            result = await asyncio.wait_for(manager.wait_closed(), 1)
+            await asyncio.wait_for(mainloop, 1)
+            return result
+
+        self.assertIsNone(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+try:
+    import tabulate
+    from spookyconsole.commands import networktables
+except ImportError as e:
+    raise unittest.SkipTest("networktables command dependencies unavailable: {}".format(e))
+
+
+class FormatFancyGridTest(unittest.TestCase):
+
+    def assert_matches_tabulate(self, header, rows):
+        self.assertEqual(networktables._format_fancy_grid(header, rows),
+                         tabulate.tabulate(rows, list(header), tablefmt="fancy_grid"))
+
+    def test_no_rows(self):
+        self.assert_matches_tabulate(("Path", "Value"), [])
+
+    def test_mixed_strings_and_numbers(self):
+        self.assert_matches_tabulate(("Table/Entry", "Path", "Type", "Value"), [
+            ("T", "sub", "", ""),
+            ("E", "  padded  ", "DOUBLE", 3.5),
+            ("E", "count", "DOUBLE", 12.0),
+            ("E", "tiny", "DOUBLE", 1e-7),
+            ("E", "flag", "BOOLEAN", True)
+        ])
+
+    def test_numeric_column(self):
+        self.assert_matches_tabulate(("Path", "Value"), [("a", 1.0), ("b", -2.25), ("c", 300), ("d", "4.125")])
+
+    def test_multiline_cells(self):
+        self.assert_matches_tabulate(("Path", "Type", "Value"), [
+            ("a", "STRING", "first line\nsecond\n3"),
+            ("b", "DOUBLE_ARRAY", (1.0, 2.5)),
+            ("c", "RAW", b"bytes")
+        ])